@@ -7,9 +7,9 @@ import abc
 import datetime
 import functools
 import numbers
-
-import dateparser
-
+import sys
+import threading
+import time
 
 from hyperschedule import util
 
@@ -20,8 +20,23 @@ class Log:
     by scrapers.
     """
 
+    def __init__(self):
+        # The formatted timestamp only changes once a second, so keep
+        # the last one around instead of formatting it for every line.
+        self._timestamp_second = None
+        self._timestamp = None
+
+    def _get_timestamp(self):
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp = time.strftime(
+                "%Y-%m-%d %I:%M:%S %p", time.localtime(second)
+            )
+            self._timestamp_second = second
+        return self._timestamp
+
     def _log(self, level, msg, *args, **kwargs):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %I:%M:%S %p")
+        timestamp = self._get_timestamp()
         msg_str = msg.format(*args, **kwargs)
         print("{} [{}] {}".format(timestamp, level.upper(), msg_str))
 
@@ -45,9 +60,155 @@ class ImplementorError(Exception):
     def __init__(self, msg, *args, **kwargs):
         """
         Construct a new `ImplementorError`, passing the `msg`, `args`, and
-        `kwargs` to `str.format`.
+        `kwargs` to `str.format`. The formatting is deferred until the
+        exception is converted to a string, so that it costs nothing
+        if the exception is caught and discarded. Note that this means
+        mutable arguments are shown as they are at that time, not as
+        they were when the exception was raised.
+
+        The exception's `args` are the unformatted `msg` followed by the
+        positional `args`; the `kwargs` are not included.
         """
-        super().__init__(msg.format(*args, **kwargs))
+        super().__init__(msg, *args)
+        self._msg = msg
+        self._format_args = args
+        self._format_kwargs = kwargs
+
+    def __str__(self):
+        try:
+            return self._msg.format(*self._format_args, **self._format_kwargs)
+        except Exception:
+            # Don't let a bad format string hide the error entirely.
+            return self._msg
+
+
+# The `dateparser.DateDataParser`, once it has been created by
+# `_get_date_data_parser`.
+_date_data_parser = None
+
+
+def _get_date_data_parser():
+    """
+    Return a `dateparser.DateDataParser` for English-language dates,
+    creating it on first use. The `dateparser` module takes a long
+    time to import and is only needed for unusual date and time
+    formats, so it is not imported at startup.
+    """
+    global _date_data_parser
+    if _date_data_parser is None:
+        import dateparser
+
+        _date_data_parser = dateparser.DateDataParser(languages=["en"])
+    return _date_data_parser
+
+
+def _dateparser_parse(string):
+    """
+    Parse `string` using `dateparser` and return a `datetime.datetime`,
+    or None if that fails.
+    """
+    return _get_date_data_parser().get_date_data(string)["date_obj"]
+
+
+# Formats tried by `_parse_date` when the string is not in ISO format,
+# before falling back to `dateparser` (which is very slow).
+_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y")
+
+# Formats tried by `_parse_time` before falling back to `dateparser`.
+_TIME_FORMATS = ("%H:%M", "%H:%M:%S", "%I:%M %p", "%I:%M%p")
+
+# Per-thread record of the format that most recently succeeded in
+# `_strptime_any`, keyed by attribute name ("date" or "time").
+_last_formats = threading.local()
+
+
+def _strptime_any(string, formats, kind):
+    """
+    Try to parse `string` with each of the `strptime` `formats` in turn
+    and return the resulting `datetime.datetime`, or None if none of
+    them match. Scrapers tend to use one format consistently, so the
+    format that last succeeded for the same `kind` of value on this
+    thread is tried first.
+    """
+    last_fmt = getattr(_last_formats, kind, None)
+    if last_fmt is not None:
+        try:
+            return datetime.datetime.strptime(string, last_fmt)
+        except ValueError:
+            pass
+    for fmt in formats:
+        if fmt == last_fmt:
+            continue
+        try:
+            dt = datetime.datetime.strptime(string, fmt)
+        except ValueError:
+            continue
+        setattr(_last_formats, kind, fmt)
+        return dt
+    return None
+
+
+# Placeholder strings which scrapers often see in place of a date or
+# time. These are rejected without trying to parse them, since
+# `dateparser` can take seconds to give up on them.
+_UNPARSEABLE = frozenset(["", "TBA", "TBD", "N/A", "ARR", "ARRANGED"])
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(string):
+    """
+    Parse the given `string` into a tuple of (year, month, day), trying
+    very hard to make something sensible out of it. The common formats
+    are handled directly, and only unusual ones are passed to
+    `dateparser`. Return None if parsing fails.
+
+    Results are cached, since scrapers tend to see the same few dates
+    over and over again. This includes failures, so that a malformed
+    string is only ever passed to `dateparser` once.
+    """
+    if string.strip().upper() in _UNPARSEABLE:
+        return None
+    try:
+        dt = datetime.datetime.fromisoformat(string)
+    except ValueError:
+        dt = _strptime_any(string, _DATE_FORMATS, "date")
+    if dt is None:
+        try:
+            dt = _dateparser_parse(string)
+        except ValueError:
+            pass
+    if dt is None:
+        return None
+    return dt.year, dt.month, dt.day
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_time(string):
+    """
+    Parse the given `string` into a tuple of (hour, minute), trying very
+    hard to make something sensible out of it. Return None if parsing
+    fails.
+
+    Results are cached, including failures, like those of
+    `_parse_date`.
+    """
+    if string.strip().upper() in _UNPARSEABLE:
+        return None
+    try:
+        # Handles the suggested HH:MM format directly, much faster
+        # than `strptime`.
+        tm = datetime.time.fromisoformat(string)
+        return tm.hour, tm.minute
+    except ValueError:
+        dt = _strptime_any(string, _TIME_FORMATS, "time")
+    if dt is None:
+        try:
+            dt = _dateparser_parse(string)
+        except ValueError:
+            pass
+    if dt is None:
+        return None
+    return dt.hour, dt.minute
 
 
 @functools.total_ordering
@@ -56,27 +217,39 @@ class Date:
     Class representing a specific day of the year. Immutable.
     """
 
+    __slots__ = ("_year", "_month", "_day")
+
     @staticmethod
-    def _from_json(self, string):
+    def _from_json(string):
         if string is None:
             return None
         return Date(string)
 
-    def __init__(self, string):
+    # Map from (year, month, day) tuples to the canonical `Date` for
+    # them, so that equal dates share a single instance.
+    _instances = {}
+
+    def __new__(cls, string):
         """
         Construct a date from the given `string`, trying very hard to make
         something sensible out of whatever you provide. Suggested
         format is YYYY-MM-DD, but anything might work.
         """
-        try:
-            dt = dateparser.parse(string)
-            if dt is None:
-                raise ValueError
-        except ValueError:
-            raise ImplementorError("Date got invalid string: {}", string) from None
-        self._year = dt.year
-        self._month = dt.month
-        self._day = dt.day
+        if not isinstance(string, str):
+            raise ImplementorError("Date got invalid string: {}", string)
+        key = _parse_date(string)
+        if key is None:
+            raise ImplementorError("Date got invalid string: {}", string)
+        self = cls._instances.get(key)
+        if self is None:
+            self = super().__new__(cls)
+            self._year, self._month, self._day = key
+            cls._instances[key] = self
+        return self
+
+    def __getnewargs__(self):
+        # So that copying and pickling go through the cache in `__new__`.
+        return ("{:04d}-{:02d}-{:02d}".format(self._year, self._month, self._day),)
 
     def _to_json(self):
         return "{}-{}-{}".format(self._year, self._month, self._day)
@@ -112,26 +285,38 @@ class Time:
     Class representing a specific time of day. Immutable.
     """
 
+    __slots__ = ("_hour", "_minute")
+
     @staticmethod
-    def _from_json(self, string):
+    def _from_json(string):
         if string is None:
             return None
         return Time(string)
 
-    def __init__(self, string):
+    # Map from (hour, minute) tuples to the canonical `Time` for them.
+    _instances = {}
+
+    def __new__(cls, string):
         """
         Construct a time from the given `string`, trying very hard to make
         something sensible out of whatever you provide. Suggested
         format is HH:MM, but anything might work.
         """
-        try:
-            dt = dateparser.parse(string)
-            if dt is None:
-                raise ValueError
-        except ValueError:
-            raise ImplementorError("Time got invalid string: {}", string) from None
-        self._hour = dt.hour
-        self._minute = dt.minute
+        if not isinstance(string, str):
+            raise ImplementorError("Time got invalid string: {}", string)
+        key = _parse_time(string)
+        if key is None:
+            raise ImplementorError("Time got invalid string: {}", string)
+        self = cls._instances.get(key)
+        if self is None:
+            self = super().__new__(cls)
+            self._hour, self._minute = key
+            cls._instances[key] = self
+        return self
+
+    def __getnewargs__(self):
+        # So that copying and pickling go through the cache in `__new__`.
+        return (self._to_json(),)
 
     def _to_json(self):
         return "{:02d}:{:02d}".format(self._hour, self._minute)
@@ -163,8 +348,13 @@ class Weekdays:
     through Sunday).
     """
 
+    __slots__ = ("_mask",)
+
     CHARS = "MTWRFSU"
 
+    # Map from each day character to its bit in `_mask`.
+    _BITS = {c: 1 << i for i, c in enumerate(CHARS)}
+
     @staticmethod
     def _from_json(string):
         if string is None:
@@ -177,7 +367,8 @@ class Weekdays:
         pass `days`, it should be an iterable containing days to add
         to the `Weekdays`, for example "MWF".
         """
-        self._days = set()
+        # Bit i is set if the day CHARS[i] is included.
+        self._mask = 0
         if days is not None:
             for day in days:
                 self.add_day(day)
@@ -188,40 +379,51 @@ class Weekdays:
         `Weekdays`.
         """
         day = day.upper()
-        if day not in Weekdays.CHARS:
+        bit = Weekdays._BITS.get(day)
+        if bit is None:
             raise ImplementorError("add_day got invalid day: {}", day)
-        if day in self._days:
+        if self._mask & bit:
             log.warn("add_day got same day more than once: {}", day)
-        self._days.add(day)
+        self._mask |= bit
 
     def _check_valid(self):
         """
         Raise `ImplementorError` unless this `Weekdays` object is suitable
         for embedding in other objects.
         """
-        if not self._days:
+        if not self._mask:
             raise ImplementorError("Weekdays has no days")
 
     def _to_json(self):
-        return "".join(sorted(self._days, key=lambda d: Weekdays.CHARS.index(d)))
+        return Weekdays._STRINGS[self._mask]
 
     def __eq__(self, other):
         if type(self) is not type(other):
             return NotImplemented
-        return self._days == other._days
+        return self._mask == other._mask
 
     def __lt__(self, other):
         if type(self) is not type(other):
             return NotImplemented
-        return sorted(Weekdays.CHARS.index(d) for d in self._days) < sorted(
-            Weekdays.CHARS.index(d) for d in other._days
-        )
+        return Weekdays._SORT_KEYS[self._mask] < Weekdays._SORT_KEYS[other._mask]
 
     def __hash__(self):
-        return hash(tuple(sorted(self._days)))
+        return hash(self._mask)
 
     def __str__(self):
-        return "".join(sorted(self._days, key=lambda d: Weekdays.CHARS.index(d)))
+        return Weekdays._STRINGS[self._mask]
+
+
+# Lookup tables indexed by `Weekdays._mask`: the string of included
+# days in order, and the list of their indices (used for ordering).
+Weekdays._STRINGS = tuple(
+    "".join(c for i, c in enumerate(Weekdays.CHARS) if mask >> i & 1)
+    for mask in range(1 << len(Weekdays.CHARS))
+)
+Weekdays._SORT_KEYS = tuple(
+    [i for i in range(len(Weekdays.CHARS)) if mask >> i & 1]
+    for mask in range(1 << len(Weekdays.CHARS))
+)
 
 
 @functools.total_ordering
@@ -235,15 +437,22 @@ class Subterm:
     `SecondHalfTerm`, and so on.
     """
 
+    __slots__ = ("_subterms", "_str")
+
     @staticmethod
     def _from_json(lst):
         if lst is None:
             return None
         return Subterm(*lst)
 
-    def __init__(self, *subterms):
+    # Map from tuples of booleans to the canonical `Subterm` for them.
+    # There are only a handful of distinct subterms in practice, so
+    # construction returns a shared instance rather than a new one.
+    _instances = {}
+
+    def __new__(cls, *subterms):
         """
-        Construct a new `Subterm` from the given arguments, booleans. The
+        Return the `Subterm` for the given arguments, booleans. The
         number of arguments is the number of parts into which the term
         is divided. If an argument is truthy, then that sub-term is
         included in this `Subterm`; if an argument is falsy, then it
@@ -259,7 +468,22 @@ class Subterm:
             raise ImplementorError("Subterm got no arguments")
         if not any(subterms):
             raise ImplementorError("Subterm got no truthy arguments: {}", subterms)
-        self._subterms = tuple(map(bool, subterms))
+        key = tuple(map(bool, subterms))
+        self = cls._instances.get(key)
+        if self is None:
+            self = super().__new__(cls)
+            self._subterms = key
+            self._str = ", ".join(
+                "{}/{}".format(idx + 1, len(key))
+                for idx, included in enumerate(key)
+                if included
+            )
+            cls._instances[key] = self
+        return self
+
+    def __getnewargs__(self):
+        # So that copying and pickling go through the cache in `__new__`.
+        return self._subterms
 
     def _to_json(self):
         return list(self._subterms)
@@ -281,12 +505,7 @@ class Subterm:
         return hash(tuple(self._subterms))
 
     def __str__(self):
-        fractions = [
-            "{}/{}".format(idx + 1, len(self._subterms))
-            for idx, included in enumerate(self._subterms)
-            if included
-        ]
-        return ", ".join(fractions)
+        return self._str
 
 
 # Indicates that a course runs for the entire term.
@@ -320,6 +539,16 @@ class Session:
     Class representing a single recurring meeting time for a course.
     """
 
+    __slots__ = (
+        "_start_date",
+        "_end_date",
+        "_weekdays",
+        "_start_time",
+        "_end_time",
+        "_subterm",
+        "_location",
+    )
+
     @staticmethod
     def _from_json(obj):
         if obj is None:
@@ -330,7 +559,7 @@ class Session:
             weekdays=Weekdays._from_json(obj["scheduleDays"]),
             start_time=Time._from_json(obj["scheduleStartTime"]),
             end_time=Time._from_json(obj["scheduleEndTime"]),
-            subterm=Subterm._from_json(obj["scheduleSubterms"]),
+            subterm=Subterm._from_json(obj["scheduleSubterm"]),
             location=obj["scheduleLocation"],
         )
 
@@ -395,20 +624,25 @@ class Session:
         self._end_time = None
         self._subterm = FullTerm
         self._location = None
+        # The date and time setters would each check the ordering of
+        # start and end, so store those without checking and then
+        # check once at the end.
         if start_date is not None:
-            self.set_start_date(start_date)
+            self._store_start_date(start_date)
         if end_date is not None:
-            self.set_end_date(end_date)
+            self._store_end_date(end_date)
         if weekdays is not None:
             self.set_weekdays(weekdays)
         if start_time is not None:
-            self.set_start_time(start_time)
+            self._store_start_time(start_time)
         if end_time is not None:
-            self.set_end_time(end_time)
+            self._store_end_time(end_time)
         if subterm is not None:
             self.set_subterm(subterm)
         if location is not None:
             self.set_location(location)
+        self._check_dates()
+        self._check_times()
 
     def set_dates(self, start_date, end_date):
         """
@@ -434,20 +668,34 @@ class Session:
         Set the start `Date` for this course session. No course meetings
         will occur before the `start_date`.
         """
+        self._store_start_date(start_date)
+        self._check_dates()
+
+    def _store_start_date(self, start_date):
+        """
+        Validate and store the start `Date` for this course session,
+        without checking it against the end date.
+        """
         if not isinstance(start_date, Date):
             raise ImplementorError("set_start_date got non-Date: {}", start_date)
         self._start_date = start_date
-        self._check_dates()
 
     def set_end_date(self, end_date):
         """
         Set the end `Date` for this course session. No course meetings
         will occur after the `end_date`.
         """
+        self._store_end_date(end_date)
+        self._check_dates()
+
+    def _store_end_date(self, end_date):
+        """
+        Validate and store the end `Date` for this course session,
+        without checking it against the start date.
+        """
         if not isinstance(end_date, Date):
             raise ImplementorError("set_end_date got non-Date: {}", end_date)
         self._end_date = end_date
-        self._check_dates()
 
     def set_weekdays(self, weekdays):
         """
@@ -464,19 +712,33 @@ class Session:
         """
         Set the start `Time` for this course session.
         """
+        self._store_start_time(start_time)
+        self._check_times()
+
+    def _store_start_time(self, start_time):
+        """
+        Validate and store the start `Time` for this course session,
+        without checking it against the end time.
+        """
         if not isinstance(start_time, Time):
             raise ImplementorError("set_start_time got non-Time: {}", start_time)
         self._start_time = start_time
-        self._check_times()
 
     def set_end_time(self, end_time):
         """
         Set the end `Time` for this course session.
         """
+        self._store_end_time(end_time)
+        self._check_times()
+
+    def _store_end_time(self, end_time):
+        """
+        Validate and store the end `Time` for this course session,
+        without checking it against the start time.
+        """
         if not isinstance(end_time, Time):
             raise ImplementorError("set_end_time got non-Time: {}", end_time)
         self._end_time = end_time
-        self._check_times()
 
     def set_subterm(self, subterm):
         """
@@ -537,7 +799,7 @@ class Session:
         return {
             "scheduleStartDate": self._start_date,
             "scheduleEndDate": self._end_date,
-            "scheduleWeekdays": self._weekdays,
+            "scheduleDays": self._weekdays,
             "scheduleStartTime": self._start_time,
             "scheduleEndTime": self._end_time,
             "scheduleSubterm": self._subterm,
@@ -693,6 +955,21 @@ class Course:
     instead represented by multiple `Course` objects.
     """
 
+    __slots__ = (
+        "_code",
+        "_name",
+        "_description",
+        "_schedule",
+        "_instructors",
+        "_num_credits",
+        "_enrollment_status",
+        "_num_seats_filled",
+        "_num_seats_total",
+        "_waitlist_length",
+        "_sort_key",
+        "_mutual_exclusion_key",
+    )
+
     @staticmethod
     def _from_json(obj):
         return Course(
@@ -825,7 +1102,10 @@ class Course:
         """
         if not isinstance(code, str):
             raise ImplementorError("set_code got non-string: {}", code)
-        self._code = code
+        # Course codes are used as dictionary keys, and interning them
+        # makes those lookups cheaper. `sys.intern` only accepts exact
+        # strings, so convert subclasses (e.g. from BeautifulSoup).
+        self._code = sys.intern(str(code))
 
     def set_name(self, name):
         """
@@ -1169,6 +1449,8 @@ class ScraperResult:
     object.
     """
 
+    __slots__ = ("_term", "_courses")
+
     @staticmethod
     def _from_json(self, obj):
         return ScraperResult(term=obj["term"], courses=obj["courses"])
@@ -1203,10 +1485,13 @@ class ScraperResult:
         """
         if not isinstance(course, Course):
             raise ImplementorError("add_course got non-course: {}", course)
-        code = course.get_code()
-        if code in self._courses:
+        code = course._code
+        num_courses = len(self._courses)
+        # Only look up the code once in the usual case that it is new.
+        self._courses.setdefault(code, course)
+        if len(self._courses) == num_courses:
             log.warn("multiple courses with same code: {}", code)
-        self._courses[code] = course
+            self._courses[code] = course
 
     def set_term(self, term):
         """
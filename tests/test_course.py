@@ -0,0 +1,37 @@
+import sys
+
+from hyperschedule import Course, ScraperResult, Term
+
+
+class Code(str):
+    """
+    A `str` subclass, like the strings returned by BeautifulSoup.
+    """
+
+
+def test_set_code_accepts_str_subclass():
+    course = Course(code=Code("CS 005 HM-01"))
+    assert type(course._code) is str
+    assert course._code == "CS 005 HM-01"
+    assert course._code is sys.intern("CS 005 HM-01")
+
+
+def test_add_course():
+    result = ScraperResult()
+    first = Course(code="CS 005 HM-01")
+    second = Course(code="CS 005 HM-02")
+    result.add_course(first)
+    result.add_course(second)
+    assert result._courses == {"CS 005 HM-01": first, "CS 005 HM-02": second}
+
+
+def test_add_course_duplicate_code_keeps_last(capsys):
+    result = ScraperResult(term=Term(code="FA24", name="Fall 2024", sort_key=[2024]))
+    first = Course(code="CS 005 HM-01", name="First")
+    second = Course(code="CS 005 HM-01", name="Second")
+    result.add_course(first)
+    assert "multiple courses" not in capsys.readouterr().out
+    result.add_course(second)
+    assert "multiple courses with same code: CS 005 HM-01" in capsys.readouterr().out
+    assert len(result._courses) == 1
+    assert result._courses["CS 005 HM-01"] is second
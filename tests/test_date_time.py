@@ -0,0 +1,70 @@
+import pytest
+
+from hyperschedule import Date, ImplementorError, Time
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        # ISO format, handled by fromisoformat.
+        "2024-01-15",
+        # Each of _DATE_FORMATS.
+        "2024-1-15",
+        "2024/01/15",
+        "01/15/2024",
+    ],
+)
+def test_date_formats(string):
+    date = Date(string)
+    assert (date._year, date._month, date._day) == (2024, 1, 15)
+
+
+@pytest.mark.parametrize(
+    "string, hour, minute",
+    [
+        # ISO format, handled by fromisoformat.
+        ("09:05", 9, 5),
+        ("21:05:30", 21, 5),
+        # Each of _TIME_FORMATS.
+        ("9:05", 9, 5),
+        ("9:05:30", 9, 5),
+        ("9:05 PM", 21, 5),
+        ("9:05pm", 21, 5),
+        ("12:30 AM", 0, 30),
+    ],
+)
+def test_time_formats(string, hour, minute):
+    time = Time(string)
+    assert (time._hour, time._minute) == (hour, minute)
+
+
+def test_date_fallback_to_dateparser():
+    pytest.importorskip("dateparser")
+    date = Date("January 15, 2024")
+    assert (date._year, date._month, date._day) == (2024, 1, 15)
+
+
+@pytest.mark.parametrize(
+    "value", ["", "   ", "TBA", "tbd", "N/A", "ARR", " Arranged ", None, 20240115]
+)
+@pytest.mark.parametrize("cls", [Date, Time])
+def test_invalid_strings(cls, value):
+    with pytest.raises(ImplementorError):
+        cls(value)
+
+
+def test_date_interning():
+    assert Date("2024-01-05") is Date("2024-1-5")
+    assert Date("2024-01-05") is Date("01/05/2024")
+    assert Date("2024-01-05") is not Date("2024-01-06")
+
+
+def test_time_interning():
+    assert Time("09:00") is Time("9:00")
+    assert Time("21:00") is Time("9:00 PM")
+    assert Time("09:00") is not Time("21:00")
+
+
+def test_date_ordering():
+    assert Date("2023-12-31") < Date("2024-01-01")
+    assert hash(Date("2024-01-05")) == hash(Date("2024/01/05"))
@@ -0,0 +1,36 @@
+import pytest
+
+from hyperschedule import ImplementorError
+
+
+def test_message_is_formatted():
+    error = ImplementorError("got {} and {key}", 1, key="two")
+    assert str(error) == "got 1 and two"
+    assert error.args == ("got {} and {key}", 1)
+
+
+def test_formatting_is_deferred():
+    items = []
+    error = ImplementorError("got {}", items)
+    items.append(1)
+    assert str(error) == "got [1]"
+
+
+def test_raised_message():
+    with pytest.raises(ImplementorError, match="^bad value: 3$"):
+        raise ImplementorError("bad value: {}", 3)
+
+
+@pytest.mark.parametrize(
+    "msg, args, kwargs",
+    [
+        ("missing {} {}", (1,), {}),
+        ("missing {key}", (), {}),
+        ("unbalanced {", (), {}),
+        ("attribute {0.foo}", (1,), {}),
+        ("conversion {:d}", ("x",), {}),
+        ("index {0[1]}", (None,), {}),
+    ],
+)
+def test_bad_format_falls_back_to_template(msg, args, kwargs):
+    assert str(ImplementorError(msg, *args, **kwargs)) == msg
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from hyperschedule import (
+    Date,
+    FirstHalfTerm,
+    ImplementorError,
+    Session,
+    Time,
+    Weekdays,
+)
+
+
+def to_json(obj):
+    """
+    Recursively convert Hyperschedule objects into JSON-compatible
+    values using their `_to_json` methods.
+    """
+    if hasattr(obj, "_to_json"):
+        return to_json(obj._to_json())
+    if isinstance(obj, dict):
+        return {key: to_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [to_json(item) for item in obj]
+    return obj
+
+
+def round_trip(session):
+    return Session._from_json(json.loads(json.dumps(to_json(session))))
+
+
+def test_session_round_trip():
+    session = Session(
+        start_date=Date("2024-01-15"),
+        end_date=Date("2024-05-01"),
+        weekdays=Weekdays("MWF"),
+        start_time=Time("09:00"),
+        end_time=Time("10:15"),
+        subterm=FirstHalfTerm,
+        location="Shanahan 2460",
+    )
+    assert round_trip(session) == session
+
+
+def test_session_round_trip_defaults():
+    session = Session(
+        weekdays=Weekdays("TR"), start_time=Time("13:15"), end_time=Time("14:30")
+    )
+    assert round_trip(session) == session
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("start_date", "2024-01-15"),
+        ("end_date", Time("09:00")),
+        ("weekdays", "MWF"),
+        ("start_time", "09:00"),
+        ("end_time", Date("2024-01-15")),
+        ("subterm", True),
+        ("location", 42),
+    ],
+)
+def test_constructor_type_errors_match_setters(field, value):
+    with pytest.raises(ImplementorError) as from_constructor:
+        Session(**{field: value})
+    with pytest.raises(ImplementorError) as from_setter:
+        getattr(Session(), "set_" + field)(value)
+    assert str(from_constructor.value) == str(from_setter.value)
+    assert str(from_setter.value).startswith("set_{} got non-".format(field))
+
+
+def test_constructor_rejects_empty_weekdays():
+    with pytest.raises(ImplementorError):
+        Session(weekdays=Weekdays())
+
+
+@pytest.mark.parametrize("end", ["2024-01-15", "2024-01-14"])
+def test_start_date_not_before_end_date(end):
+    start_date, end_date = Date("2024-01-15"), Date(end)
+    with pytest.raises(ImplementorError):
+        Session(start_date=start_date, end_date=end_date)
+    with pytest.raises(ImplementorError):
+        Session().set_dates(start_date, end_date)
+    with pytest.raises(ImplementorError):
+        Session(end_date=end_date).set_start_date(start_date)
+
+
+@pytest.mark.parametrize("end", ["09:00", "08:59"])
+def test_start_time_not_before_end_time(end):
+    start_time, end_time = Time("09:00"), Time(end)
+    with pytest.raises(ImplementorError):
+        Session(start_time=start_time, end_time=end_time)
+    with pytest.raises(ImplementorError):
+        Session().set_times(start_time, end_time)
+    with pytest.raises(ImplementorError):
+        Session(end_time=end_time).set_start_time(start_time)
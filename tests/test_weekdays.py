@@ -0,0 +1,50 @@
+import pytest
+
+from hyperschedule import ImplementorError, Weekdays
+
+
+def test_str_is_in_week_order():
+    assert str(Weekdays("FWM")) == "MWF"
+    assert str(Weekdays("ursmtwf")) == "MTWRFSU"
+    assert str(Weekdays()) == ""
+    assert Weekdays("RT")._to_json() == "TR"
+
+
+def test_add_day():
+    weekdays = Weekdays()
+    weekdays.add_day("r")
+    weekdays.add_day("M")
+    assert str(weekdays) == "MR"
+
+
+@pytest.mark.parametrize("day", ["X", "", "MW"])
+def test_add_day_invalid(day):
+    with pytest.raises(ImplementorError):
+        Weekdays().add_day(day)
+
+
+def test_check_valid():
+    Weekdays("M")._check_valid()
+    with pytest.raises(ImplementorError):
+        Weekdays()._check_valid()
+
+
+def test_equality_and_hash():
+    assert Weekdays("MWF") == Weekdays("FMW")
+    assert Weekdays("MWF") != Weekdays("MW")
+    assert hash(Weekdays("MWF")) == hash(Weekdays("WFM"))
+    assert len({Weekdays("TR"), Weekdays("RT"), Weekdays("M")}) == 2
+
+
+def test_ordering():
+    # Ordered like the sorted lists of day indices.
+    assert Weekdays("M") < Weekdays("MW")
+    assert Weekdays("MW") < Weekdays("MWF")
+    assert Weekdays("MWF") < Weekdays("MR")
+    assert Weekdays("MR") < Weekdays("T")
+    assert Weekdays("U") > Weekdays("SU")
+    assert sorted([Weekdays("TR"), Weekdays("MWF"), Weekdays("F")]) == [
+        Weekdays("MWF"),
+        Weekdays("TR"),
+        Weekdays("F"),
+    ]